@@ -2,31 +2,51 @@
 # Run with: python game.py
 
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import List, Dict, Optional
-import random
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 
 # ---------- Core enums ----------
 
-class CardKind(str, Enum):
-    TROOP = "TROOP"
-    STRATEGEM = "STRATEGEM"
-    AMBUSH = "AMBUSH"
+# Int-valued so they index lists/arrays directly (and port to Numba).
+
+class CardKind(IntEnum):
+    TROOP = 0
+    STRATEGEM = 1
+    AMBUSH = 2
+
+
+class ZoneId(IntEnum):
+    LEFT = 0
+    CENTER = 1
+    RIGHT = 2
+    RESERVE = 3
+    HQ = 4
+    SUPPLY = 5
 
 
-class ZoneId(str, Enum):
-    LEFT = "LEFT"
-    CENTER = "CENTER"
-    RIGHT = "RIGHT"
-    RESERVE = "RESERVE"
-    HQ = "HQ"
-    SUPPLY = "SUPPLY"
+ZONE_DISPLAY_ORDER: Tuple[ZoneId, ...] = (
+    ZoneId.LEFT, ZoneId.CENTER, ZoneId.RIGHT, ZoneId.RESERVE, ZoneId.HQ, ZoneId.SUPPLY,
+)
 
+# unit slots per zone, indexed by ZoneId
+ZONE_CAPACITY: Tuple[int, ...] = (
+    3,  # LEFT
+    3,  # CENTER
+    3,  # RIGHT
+    4,  # RESERVE
+    2,  # HQ
+    2,  # SUPPLY
+)
+
+# dtype for card ids wherever they're stored in arrays (decks, unit columns)
+CARD_ID_DTYPE = np.uint16
 
 # ---------- Data models ----------
 
-@dataclass
+@dataclass(slots=True)
 class TroopStats:
     str: int
     arm: int
@@ -35,7 +55,7 @@ class TroopStats:
     max_ammo: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Card:
     id: str
     name: str
@@ -43,7 +63,7 @@ class Card:
     text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TroopCard(Card):
     stats: TroopStats = field(default_factory=TroopStats)
 
@@ -51,7 +71,7 @@ class TroopCard(Card):
         self.kind = CardKind.TROOP
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategemCard(Card):
     cost_cp: int = 0
 
@@ -59,7 +79,7 @@ class StrategemCard(Card):
         self.kind = CardKind.STRATEGEM
 
 
-@dataclass
+@dataclass(slots=True)
 class AmbushCard(Card):
     cost_cp: int = 0
     trigger: str = "ON_ENTER"  # future-proof
@@ -68,76 +88,251 @@ class AmbushCard(Card):
         self.kind = CardKind.AMBUSH
 
 
-@dataclass
+@dataclass(slots=True)
 class Unit:
-    """A troop that is on the battlefield (instance of a TroopCard)."""
-    card: TroopCard
-    owner: int  # 1 or 2
-    zone: ZoneId
-    coh: int
-    ammo: int
-    attacked_this_turn: bool = False
+    """A troop that is on the battlefield (instance of a TroopCard).
+
+    Unit state lives in the Game's u_* columns; this is a view onto row uid.
+    """
+    game: "Game"
+    uid: int
+
+    @property
+    def card_id(self) -> int:
+        return int(self.game.u_card[self.uid])
+
+    @property
+    def card(self) -> TroopCard:
+        return CARDS[self.card_id]
 
     @property
     def name(self) -> str:
         return self.card.name
 
+    @property
+    def owner(self) -> int:
+        return int(self.game.u_owner[self.uid])
+
+    @property
+    def zone(self) -> ZoneId:
+        return ZoneId(self.game.u_zone[self.uid])
+
     @property
     def STR(self) -> int:
-        return self.card.stats.str
+        return int(self.game.u_str[self.uid])
 
     @property
     def ARM(self) -> int:
-        return self.card.stats.arm
+        return int(self.game.u_arm[self.uid])
+
+    @property
+    def coh(self) -> int:
+        return int(self.game.u_coh[self.uid])
+
+    @coh.setter
+    def coh(self, value: int) -> None:
+        self.game.u_coh[self.uid] = value
+        self.game.touch_zone(self.zone)
+
+    @property
+    def ammo(self) -> int:
+        return int(self.game.u_ammo[self.uid])
+
+    @ammo.setter
+    def ammo(self, value: int) -> None:
+        self.game.u_ammo[self.uid] = value
+        self.game.touch_zone(self.zone)
+
+    @property
+    def attacked_this_turn(self) -> bool:
+        return bool(self.game.u_attacked[self.uid])
+
+    @attacked_this_turn.setter
+    def attacked_this_turn(self, value: bool) -> None:
+        self.game.u_attacked[self.uid] = value
+        self.game.touch_zone(self.zone)
 
     def is_alive(self) -> bool:
         return self.coh > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Zone:
     id: ZoneId
     capacity: int
-    units: List[Unit] = field(default_factory=list)
+    count: int = 0
 
     def has_space(self) -> bool:
-        return len(self.units) < self.capacity
+        return self.count < self.capacity
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
     pid: int
     morale: int = 25
     cp: int = 0
-    deck: List[Card] = field(default_factory=list)
-    hand: List[Card] = field(default_factory=list)
-    discard: List[Card] = field(default_factory=list)
+    # deck/hand/discard hold card ids (indices into CARDS)
+    # arrays have no single truth value, so the deck is left out of __eq__
+    deck: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=CARD_ID_DTYPE), compare=False)
+    deck_top: int = -1  # index of the top card in deck; -1 when empty
+    hand: List[int] = field(default_factory=list)
+    discard: List[int] = field(default_factory=list)
+
+
+# ---------- Sample cards ----------
+
+# 5 sample troops
+marines = TroopCard(
+    id="troop_marines",
+    name="Tactical Marines",
+    kind=CardKind.TROOP,
+    text="+1 STR if another Infantry is in zone (not implemented yet).",
+    stats=TroopStats(str=6, arm=4, coh=6, speed=1, max_ammo=0),
+)
+scouts = TroopCard(
+    id="troop_scouts",
+    name="Scouts",
+    kind=CardKind.TROOP,
+    text="Ranged unit (ammo 2, range 1 later).",
+    stats=TroopStats(str=4, arm=2, coh=4, speed=1, max_ammo=2),
+)
+cavalry = TroopCard(
+    id="troop_cavalry",
+    name="Assault Cavalry",
+    kind=CardKind.TROOP,
+    text="Fast movers.",
+    stats=TroopStats(str=5, arm=3, coh=5, speed=2, max_ammo=0),
+)
+heavy = TroopCard(
+    id="troop_heavy",
+    name="Heavy Weapons Team",
+    kind=CardKind.TROOP,
+    text="Artillery-ish (ammo 2 later).",
+    stats=TroopStats(str=7, arm=2, coh=4, speed=1, max_ammo=2),
+)
+elite = TroopCard(
+    id="troop_elite",
+    name="Elite Veterans",
+    kind=CardKind.TROOP,
+    text="Hard hitters.",
+    stats=TroopStats(str=7, arm=4, coh=6, speed=1, max_ammo=0),
+)
+
+# 3 sample strategems
+suppression = StrategemCard(
+    id="strat_suppression",
+    name="Suppressive Fire",
+    kind=CardKind.STRATEGEM,
+    text="Choose a zone; enemy can't move next turn (not implemented yet).",
+    cost_cp=2,
+)
+march = StrategemCard(
+    id="strat_march",
+    name="Forced March",
+    kind=CardKind.STRATEGEM,
+    text="One troop gets +1 move this turn (not implemented yet).",
+    cost_cp=1,
+)
+dig_in = StrategemCard(
+    id="strat_dig_in",
+    name="Dig In",
+    kind=CardKind.STRATEGEM,
+    text="Target zone gets +1 ARM for your troops this turn (not implemented yet).",
+    cost_cp=1,
+)
+
+# 2 sample ambushes
+killzone = AmbushCard(
+    id="amb_killzone",
+    name="Prepared Killzone",
+    kind=CardKind.AMBUSH,
+    text="When enemy enters zone: deal 3 damage to one troop (not implemented yet).",
+    cost_cp=1,
+    trigger="ON_ENTER",
+)
+booby = AmbushCard(
+    id="amb_booby",
+    name="Booby Traps",
+    kind=CardKind.AMBUSH,
+    text="When enemy enters zone: deal 2 damage (not implemented yet).",
+    cost_cp=0,
+    trigger="ON_ENTER",
+)
+
+# Card registry: a card id is an index into CARDS. Cards are shared
+# flyweights; decks, hands and units only ever store ids.
+CARDS: Tuple[Card, ...] = (
+    marines, scouts, cavalry, heavy, elite,
+    suppression, march, dig_in,
+    killzone, booby,
+)
+CARD_IDS: Dict[str, int] = {c.id: i for i, c in enumerate(CARDS)}
+
+
+def _troop_stat(attr: str) -> np.ndarray:
+    return np.array(
+        [getattr(c.stats, attr) if c.kind == CardKind.TROOP else 0 for c in CARDS],
+        dtype=np.int8,
+    )
+
+
+# per-card columns, indexed by card id
+CARD_KIND = np.array([c.kind for c in CARDS], dtype=np.int8)
+CARD_STR = _troop_stat("str")
+CARD_ARM = _troop_stat("arm")
+CARD_COH = _troop_stat("coh")
+CARD_MAX_AMMO = _troop_stat("max_ammo")
+
+# print_hand detail text, indexed by CardKind
+HAND_FORMATTERS: Tuple[Callable[[Card], str], ...] = (
+    lambda c: f" STR {c.stats.str} ARM {c.stats.arm} COH {c.stats.coh}",  # TROOP
+    lambda c: f" (CP {c.cost_cp})",                                       # STRATEGEM
+    lambda c: f" (CP {c.cost_cp}, {c.trigger})",                          # AMBUSH
+)
 
 
 # ---------- Game engine ----------
 
 class Game:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.turn = 1
         self.active_pid = 1
+        # all game randomness goes through this; same seed -> same game
+        self.rng = np.random.default_rng(seed)
+
+        # indexed by ZoneId
+        self.zones: List[Zone] = [Zone(zid, ZONE_CAPACITY[zid]) for zid in ZoneId]
+        self._zones_list: Tuple[Zone, ...] = tuple(self.zones[z] for z in ZONE_DISPLAY_ORDER)
+
+        # indexed by ZoneId
+        self.adj: List[List[int]] = [
+            [ZoneId.RESERVE, ZoneId.CENTER],                                        # LEFT
+            [ZoneId.RESERVE, ZoneId.LEFT, ZoneId.RIGHT],                            # CENTER
+            [ZoneId.RESERVE, ZoneId.CENTER],                                        # RIGHT
+            [ZoneId.HQ, ZoneId.SUPPLY, ZoneId.LEFT, ZoneId.CENTER, ZoneId.RIGHT],   # RESERVE
+            [ZoneId.RESERVE],                                                       # HQ
+            [ZoneId.RESERVE],                                                       # SUPPLY
+        ]
 
-        self.zones: Dict[ZoneId, Zone] = {
-            ZoneId.LEFT: Zone(ZoneId.LEFT, 3),
-            ZoneId.CENTER: Zone(ZoneId.CENTER, 3),
-            ZoneId.RIGHT: Zone(ZoneId.RIGHT, 3),
-            ZoneId.RESERVE: Zone(ZoneId.RESERVE, 4),
-            ZoneId.HQ: Zone(ZoneId.HQ, 2),
-            ZoneId.SUPPLY: Zone(ZoneId.SUPPLY, 2),
-        }
-
-        self.adj: Dict[ZoneId, List[ZoneId]] = {
-            ZoneId.HQ: [ZoneId.RESERVE],
-            ZoneId.SUPPLY: [ZoneId.RESERVE],
-            ZoneId.RESERVE: [ZoneId.HQ, ZoneId.SUPPLY, ZoneId.LEFT, ZoneId.CENTER, ZoneId.RIGHT],
-            ZoneId.LEFT: [ZoneId.RESERVE, ZoneId.CENTER],
-            ZoneId.CENTER: [ZoneId.RESERVE, ZoneId.LEFT, ZoneId.RIGHT],
-            ZoneId.RIGHT: [ZoneId.RESERVE, ZoneId.CENTER],
-        }
+        # Units on the battlefield, struct-of-arrays: one row per unit slot.
+        # Every unit is in some zone, so the zone capacities bound the rows.
+        max_units = sum(ZONE_CAPACITY)
+        self.u_owner = np.zeros(max_units, dtype=np.int8)    # 1 or 2
+        self.u_zone = np.zeros(max_units, dtype=np.int8)     # ZoneId
+        self.u_card = np.zeros(max_units, dtype=CARD_ID_DTYPE)  # card id
+        self.u_str = np.zeros(max_units, dtype=np.int8)
+        self.u_arm = np.zeros(max_units, dtype=np.int8)
+        self.u_coh = np.zeros(max_units, dtype=np.int8)
+        self.u_ammo = np.zeros(max_units, dtype=np.int8)
+        self.u_attacked = np.zeros(max_units, dtype=np.bool_)
+        # row holds a unit (alive or not, see Unit.is_alive); units leave
+        # their zone only when the row is cleared
+        self.u_used = np.zeros(max_units, dtype=np.bool_)
+
+        # print_board cache: (version, line) per zone. Anything that changes a
+        # zone's units bumps its version through touch_zone().
+        self._zone_version: List[int] = [0] * len(self.zones)
+        self._zone_display_cache: List[Optional[Tuple[int, str]]] = [None] * len(self.zones)
 
         self.p1 = PlayerState(pid=1)
         self.p2 = PlayerState(pid=2)
@@ -148,86 +343,8 @@ class Game:
     # ----- setup -----
 
     def _init_sample_decks(self) -> None:
-        # 5 sample troops
-        marines = TroopCard(
-            id="troop_marines",
-            name="Tactical Marines",
-            kind=CardKind.TROOP,
-            text="+1 STR if another Infantry is in zone (not implemented yet).",
-            stats=TroopStats(str=6, arm=4, coh=6, speed=1, max_ammo=0),
-        )
-        scouts = TroopCard(
-            id="troop_scouts",
-            name="Scouts",
-            kind=CardKind.TROOP,
-            text="Ranged unit (ammo 2, range 1 later).",
-            stats=TroopStats(str=4, arm=2, coh=4, speed=1, max_ammo=2),
-        )
-        cavalry = TroopCard(
-            id="troop_cavalry",
-            name="Assault Cavalry",
-            kind=CardKind.TROOP,
-            text="Fast movers.",
-            stats=TroopStats(str=5, arm=3, coh=5, speed=2, max_ammo=0),
-        )
-        heavy = TroopCard(
-            id="troop_heavy",
-            name="Heavy Weapons Team",
-            kind=CardKind.TROOP,
-            text="Artillery-ish (ammo 2 later).",
-            stats=TroopStats(str=7, arm=2, coh=4, speed=1, max_ammo=2),
-        )
-        elite = TroopCard(
-            id="troop_elite",
-            name="Elite Veterans",
-            kind=CardKind.TROOP,
-            text="Hard hitters.",
-            stats=TroopStats(str=7, arm=4, coh=6, speed=1, max_ammo=0),
-        )
-
-        # 3 sample strategems
-        suppression = StrategemCard(
-            id="strat_suppression",
-            name="Suppressive Fire",
-            kind=CardKind.STRATEGEM,
-            text="Choose a zone; enemy can't move next turn (not implemented yet).",
-            cost_cp=2,
-        )
-        march = StrategemCard(
-            id="strat_march",
-            name="Forced March",
-            kind=CardKind.STRATEGEM,
-            text="One troop gets +1 move this turn (not implemented yet).",
-            cost_cp=1,
-        )
-        dig_in = StrategemCard(
-            id="strat_dig_in",
-            name="Dig In",
-            kind=CardKind.STRATEGEM,
-            text="Target zone gets +1 ARM for your troops this turn (not implemented yet).",
-            cost_cp=1,
-        )
-
-        # 2 sample ambushes
-        killzone = AmbushCard(
-            id="amb_killzone",
-            name="Prepared Killzone",
-            kind=CardKind.AMBUSH,
-            text="When enemy enters zone: deal 3 damage to one troop (not implemented yet).",
-            cost_cp=1,
-            trigger="ON_ENTER",
-        )
-        booby = AmbushCard(
-            id="amb_booby",
-            name="Booby Traps",
-            kind=CardKind.AMBUSH,
-            text="When enemy enters zone: deal 2 damage (not implemented yet).",
-            cost_cp=0,
-            trigger="ON_ENTER",
-        )
-
         # Build decks (simple repeats)
-        base_deck = [
+        base_cards = [
             marines, marines,
             scouts, scouts,
             cavalry, cavalry,
@@ -236,22 +353,36 @@ class Game:
             suppression, march, dig_in,
             killzone, booby
         ]
+        base_deck = [CARD_IDS[c.id] for c in base_cards]
 
         # Copy and shuffle per player
-        self.p1.deck = base_deck[:] * 2
-        self.p2.deck = base_deck[:] * 2
-        random.shuffle(self.p1.deck)
-        random.shuffle(self.p2.deck)
+        for p in (self.p1, self.p2):
+            p.deck = np.empty(len(base_deck) * 2, dtype=CARD_ID_DTYPE)
+            p.deck[:] = base_deck * 2
+            p.deck_top = len(p.deck) - 1
+            self.rng.shuffle(p.deck)
+
+    def _reshuffle_discard(self, p: PlayerState) -> None:
+        # the deck array is sized for every card a player owns, so the
+        # discard always fits
+        count = len(p.discard)
+        p.deck[:count] = p.discard
+        p.discard.clear()
+        p.deck_top = count - 1
+        self.rng.shuffle(p.deck[:count])
 
     def _draw(self, p: PlayerState, n: int = 1) -> None:
-        for _ in range(n):
-            if not p.deck:
-                # reshuffle discard into deck
-                p.deck = p.discard[:]
-                p.discard.clear()
-                random.shuffle(p.deck)
-            if p.deck:
-                p.hand.append(p.deck.pop())
+        while n > 0:
+            if p.deck_top < 0:
+                self._reshuffle_discard(p)
+                if p.deck_top < 0:
+                    return  # nothing left to draw
+            # take the top `take` cards in one slice, top card first
+            take = min(n, p.deck_top + 1)
+            top = p.deck_top + 1
+            p.hand.extend(p.deck[top - take:top][::-1].tolist())
+            p.deck_top -= take
+            n -= take
 
     def _draw_starting_hands(self) -> None:
         self._draw(self.p1, 5)
@@ -268,25 +399,76 @@ class Game:
     def zone(self, zid: ZoneId) -> Zone:
         return self.zones[zid]
 
+    def units_in(self, zid: ZoneId, owner: Optional[int] = None) -> np.ndarray:
+        """Unit ids (rows of the u_* columns) in a zone, optionally for one owner.
+
+        Includes units at COH 0 or below that are still on the board; filter
+        with self.u_coh[ids] > 0 for living ones.
+        """
+        # int(): NumPy compares against an IntEnum through a slow object path
+        mask = self.u_used & (self.u_zone == int(zid))
+        if owner is not None:
+            mask &= self.u_owner == int(owner)
+        return np.flatnonzero(mask)
+
+    def unit(self, uid: int) -> Unit:
+        return Unit(self, uid)
+
+    def touch_zone(self, zid: ZoneId) -> None:
+        """Mark a zone's units as changed.
+
+        Game and Unit call this themselves; code that writes the u_* columns
+        directly (zone-wide passes) must call it for every zone it touched.
+        """
+        self._zone_version[zid] += 1
+
+    def _unit_display_columns(self) -> Tuple[List[List[int]], List[int], List[int], List[int]]:
+        """Unit ids per zone plus owner/card/COH columns, as plain lists.
+
+        On a board this small, per-call NumPy overhead (masks, fancy
+        indexing, scalar formatting) dwarfs the actual work.
+        """
+        by_zone: List[List[int]] = [[] for _ in self.zones]
+        for u, (used, zone) in enumerate(zip(self.u_used.tolist(), self.u_zone.tolist())):
+            if used:
+                by_zone[zone].append(u)
+        return by_zone, self.u_owner.tolist(), self.u_card.tolist(), self.u_coh.tolist()
+
+    def _format_zone(self, z: Zone, cols: Tuple[List[List[int]], List[int], List[int], List[int]]) -> str:
+        by_zone, owners, cards, cohs = cols
+        units_desc = ", ".join([
+            f"P{owners[u]}:{CARDS[cards[u]].name}(COH {cohs[u]})" for u in by_zone[z.id]
+        ]) or "—"
+        return f"{z.id.name:8} [{z.count}/{z.capacity}]: {units_desc}"
+
     def print_board(self) -> None:
         print("\n=== BATTLEFIELD ===")
-        for zid in [ZoneId.LEFT, ZoneId.CENTER, ZoneId.RIGHT, ZoneId.RESERVE, ZoneId.HQ, ZoneId.SUPPLY]:
-            z = self.zone(zid)
-            units_desc = ", ".join([f"P{u.owner}:{u.name}(COH {u.coh})" for u in z.units]) or "—"
-            print(f"{zid.value:8} [{len(z.units)}/{z.capacity}]: {units_desc}")
+        cols = None  # built on the first stale zone, shared by the rest
+        for z in self._zones_list:
+            version = self._zone_version[z.id]
+            cached = self._zone_display_cache[z.id]
+            if cached is None or cached[0] != version:
+                if cols is None:
+                    cols = self._unit_display_columns()
+                cached = (version, self._format_zone(z, cols))
+                self._zone_display_cache[z.id] = cached
+            print(cached[1])
         print("===================\n")
 
+    def hand_view(self, p: PlayerState) -> List[int]:
+        """Positions in p.hand, in display order.
+
+        Storage order isn't stable (deploys swap-remove), so the UI shows
+        the hand sorted by card instead.
+        """
+        return sorted(range(len(p.hand)), key=p.hand.__getitem__)
+
     def print_hand(self, p: PlayerState) -> None:
         print(f"P{p.pid} Hand (CP {p.cp}, Morale {p.morale}):")
-        for i, c in enumerate(p.hand, start=1):
-            extra = ""
-            if isinstance(c, TroopCard):
-                extra = f" STR {c.stats.str} ARM {c.stats.arm} COH {c.stats.coh}"
-            if isinstance(c, StrategemCard):
-                extra = f" (CP {c.cost_cp})"
-            if isinstance(c, AmbushCard):
-                extra = f" (CP {c.cost_cp}, {c.trigger})"
-            print(f"  {i}. [{c.kind.value}] {c.name}{extra}")
+        for i, hand_index in enumerate(self.hand_view(p), start=1):
+            c = CARDS[p.hand[hand_index]]
+            extra = HAND_FORMATTERS[c.kind](c)
+            print(f"  {i}. [{c.kind.name}] {c.name}{extra}")
         print()
 
     # ----- phases -----
@@ -295,31 +477,38 @@ class Game:
         p.cp = min(5, p.cp + 2)
         self._draw(p, 1)
         # reset attacks
-        for z in self.zones.values():
-            for u in z.units:
-                if u.owner == p.pid:
-                    u.attacked_this_turn = False
+        self.u_attacked[self.u_owner == p.pid] = False
 
     def deploy_troop_from_hand(self, p: PlayerState, hand_index: int, target_zone: ZoneId) -> bool:
         if hand_index < 0 or hand_index >= len(p.hand):
             return False
-        card = p.hand[hand_index]
-        if not isinstance(card, TroopCard):
+        card_id = p.hand[hand_index]
+        if CARD_KIND[card_id] != CardKind.TROOP:
             return False
         z = self.zone(target_zone)
         if not z.has_space():
             return False
 
-        unit = Unit(
-            card=card,
-            owner=p.pid,
-            zone=target_zone,
-            coh=card.stats.coh,
-            ammo=card.stats.max_ammo,
-        )
-        z.units.append(unit)
-        p.discard.append(card)
-        p.hand.pop(hand_index)
+        free = np.flatnonzero(~self.u_used)
+        if len(free) == 0:
+            return False
+
+        uid = free[0]
+        self.u_owner[uid] = p.pid
+        self.u_zone[uid] = target_zone
+        self.u_card[uid] = card_id
+        self.u_str[uid] = CARD_STR[card_id]
+        self.u_arm[uid] = CARD_ARM[card_id]
+        self.u_coh[uid] = CARD_COH[card_id]
+        self.u_ammo[uid] = CARD_MAX_AMMO[card_id]
+        self.u_attacked[uid] = False
+        self.u_used[uid] = True
+        z.count += 1
+        self.touch_zone(target_zone)
+        p.discard.append(card_id)
+        # swap-remove: hand order doesn't matter, print_hand sorts a view
+        p.hand[hand_index] = p.hand[-1]
+        p.hand.pop()
         return True
 
     # ----- very simple demo loop -----
@@ -345,7 +534,10 @@ class Game:
                 if z not in ["HQ", "RESERVE"]:
                     print("Only HQ or RESERVE for now.")
                     continue
-                ok = self.deploy_troop_from_hand(p, int(idx) - 1, ZoneId[z])
+                view = self.hand_view(p)
+                pos = int(idx) - 1
+                hand_index = view[pos] if 0 <= pos < len(view) else -1
+                ok = self.deploy_troop_from_hand(p, hand_index, ZoneId[z])
                 print("Deployed!" if ok else "Failed to deploy.")
                 self.print_board()
                 self.print_hand(p)
@@ -356,13 +548,14 @@ class Game:
             self.turn += 1
 
     def game_over(self) -> Optional[int]:
+        # Plain int compares are the fastest form in CPython; the branch-free
+        # array version for the rollout inner loop is rollout.game_over.
         if self.p1.morale <= 0:
             return 2
         if self.p2.morale <= 0:
             return 1
         return None
 
-
 def main():
     print("Clash of Commands — Starter Prototype")
     print("This version only lets you DRAW and DEPLOY troops to HQ/RESERVE.\n")
@@ -0,0 +1,356 @@
+# Clash of Commands - headless rollout kernel
+# A pure-numeric mirror of the Game state plus Numba-compiled versions of the
+# turn rules, so search code (MCTS) can play out thousands of random games.
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+from numba import njit, prange
+
+from game import (
+    CARD_ARM, CARD_COH, CARD_ID_DTYPE, CARD_KIND, CARD_MAX_AMMO, CARD_STR,
+    ZONE_CAPACITY, CardKind, Game, ZoneId,
+)
+
+
+# ---------- Layout ----------
+
+# Array sizes for state_from_game. The kernels read sizes off the arrays
+# themselves and never index past hand_count/deck_top/zone_count, so these
+# only have to be large enough; state_from_game checks that they are.
+N_ZONES = len(ZoneId)
+ZONE_SLOTS = max(ZONE_CAPACITY)
+MAX_UNITS = sum(ZONE_CAPACITY)
+DECK_CAP = 64                       # cards a player can own
+HAND_CAP = DECK_CAP                 # a player could hold every card they own
+
+# Constants the kernels read. Numba bakes globals into its on-disk cache and
+# only notices edits to this file, so they're literals here, checked against
+# game.py at import.
+KIND_TROOP = 0
+DEPLOY_ZONES = np.array([4, 3], dtype=np.int64)  # HQ, RESERVE; MVP: same as the CLI
+assert KIND_TROOP == CardKind.TROOP
+assert DEPLOY_ZONES.tolist() == [ZoneId.HQ, ZoneId.RESERVE]
+
+MAX_CP = 5
+CP_PER_TURN = 2
+
+
+class RolloutState(NamedTuple):
+    """Game state as fixed-size arrays. Player p uses row/column p - 1."""
+    turn: np.ndarray           # [turn number, active pid]
+    zone_cap: np.ndarray       # [N_ZONES]
+    zone_count: np.ndarray     # [N_ZONES]
+    zone_unit_ids: np.ndarray  # [N_ZONES, ZONE_SLOTS], -1 = empty slot
+    unit_card: np.ndarray      # [MAX_UNITS]
+    unit_owner: np.ndarray     # [MAX_UNITS], 0 = free slot
+    unit_str: np.ndarray
+    unit_arm: np.ndarray
+    unit_coh: np.ndarray
+    unit_ammo: np.ndarray
+    unit_attacked: np.ndarray
+    hand_cards: np.ndarray     # [2, HAND_CAP]
+    hand_count: np.ndarray     # [2]
+    deck: np.ndarray           # [2, DECK_CAP]
+    deck_top: np.ndarray       # [2], -1 = empty
+    discard: np.ndarray        # [2, DECK_CAP]
+    discard_count: np.ndarray  # [2]
+    morale: np.ndarray         # [2]
+    cp: np.ndarray             # [2]
+    # card stats, indexed by card id. Passed as data rather than read as
+    # globals: Numba freezes globals into the on-disk cache (cache=True) and
+    # wouldn't notice edits to the cards in game.py.
+    card_kind: np.ndarray
+    card_str: np.ndarray
+    card_arm: np.ndarray
+    card_coh: np.ndarray
+    card_ammo: np.ndarray
+
+
+def state_from_game(game: Game) -> RolloutState:
+    """Snapshot a Game into a RolloutState."""
+    zone_cap = np.zeros(N_ZONES, dtype=np.uint8)
+    zone_count = np.zeros(N_ZONES, dtype=np.uint8)
+    zone_unit_ids = np.full((N_ZONES, ZONE_SLOTS), -1, dtype=np.int8)
+    unit_card = np.zeros(MAX_UNITS, dtype=CARD_ID_DTYPE)
+    unit_owner = np.zeros(MAX_UNITS, dtype=np.uint8)
+    # signed, matching Game.u_*: COH can go to 0 or below
+    unit_str = np.zeros(MAX_UNITS, dtype=np.int8)
+    unit_arm = np.zeros(MAX_UNITS, dtype=np.int8)
+    unit_coh = np.zeros(MAX_UNITS, dtype=np.int8)
+    unit_ammo = np.zeros(MAX_UNITS, dtype=np.int8)
+    unit_attacked = np.zeros(MAX_UNITS, dtype=np.bool_)
+    uid = 0
+    for zid in ZoneId:
+        z = game.zone(zid)
+        zone_cap[zid] = z.capacity
+        for u in game.units_in(zid):
+            zone_unit_ids[zid, zone_count[zid]] = uid
+            zone_count[zid] += 1
+            unit_card[uid] = game.u_card[u]
+            unit_owner[uid] = game.u_owner[u]
+            unit_str[uid] = game.u_str[u]
+            unit_arm[uid] = game.u_arm[u]
+            unit_coh[uid] = game.u_coh[u]
+            unit_ammo[uid] = game.u_ammo[u]
+            unit_attacked[uid] = game.u_attacked[u]
+            uid += 1
+
+    hand_cards = np.zeros((2, HAND_CAP), dtype=CARD_ID_DTYPE)
+    hand_count = np.zeros(2, dtype=np.uint8)
+    deck = np.zeros((2, DECK_CAP), dtype=CARD_ID_DTYPE)
+    deck_top = np.zeros(2, dtype=np.int16)
+    discard = np.zeros((2, DECK_CAP), dtype=CARD_ID_DTYPE)
+    discard_count = np.zeros(2, dtype=np.uint8)
+    morale = np.array([game.p1.morale, game.p2.morale], dtype=np.int16)
+    cp = np.array([game.p1.cp, game.p2.cp], dtype=np.uint8)
+    for pl, p in enumerate((game.p1, game.p2)):
+        # Numba doesn't bounds-check, so refuse states the arrays can't hold
+        if len(p.deck) > DECK_CAP:
+            raise ValueError(f"P{p.pid} owns {len(p.deck)} cards; rollout supports {DECK_CAP}")
+        hand_cards[pl, :len(p.hand)] = p.hand
+        hand_count[pl] = len(p.hand)
+        deck[pl, :p.deck_top + 1] = p.deck[:p.deck_top + 1]
+        deck_top[pl] = p.deck_top
+        discard[pl, :len(p.discard)] = p.discard
+        discard_count[pl] = len(p.discard)
+
+    return RolloutState(
+        np.array([game.turn, game.active_pid], dtype=np.int32),
+        zone_cap, zone_count, zone_unit_ids,
+        unit_card, unit_owner, unit_str, unit_arm, unit_coh, unit_ammo, unit_attacked,
+        hand_cards, hand_count, deck, deck_top, discard, discard_count,
+        morale, cp,
+        CARD_KIND.copy(), CARD_STR.copy(), CARD_ARM.copy(), CARD_COH.copy(), CARD_MAX_AMMO.copy(),
+    )
+
+
+@njit(cache=True, nogil=True)
+def copy_state(st):
+    return RolloutState(
+        st.turn.copy(), st.zone_cap.copy(), st.zone_count.copy(), st.zone_unit_ids.copy(),
+        st.unit_card.copy(), st.unit_owner.copy(), st.unit_str.copy(), st.unit_arm.copy(),
+        st.unit_coh.copy(), st.unit_ammo.copy(), st.unit_attacked.copy(),
+        st.hand_cards.copy(), st.hand_count.copy(), st.deck.copy(), st.deck_top.copy(),
+        st.discard.copy(), st.discard_count.copy(),
+        st.morale.copy(), st.cp.copy(),
+        # the card table is read-only, share it
+        st.card_kind, st.card_str, st.card_arm, st.card_coh, st.card_ammo,
+    )
+
+
+# ---------- RNG (xoshiro128**) ----------
+# 32-bit words kept in uint64 lanes so Numba never promotes to float.
+
+_M32 = np.uint64(0xFFFFFFFF)
+
+
+@njit(cache=True, nogil=True)
+def _rotl(x, k):
+    return ((x << np.uint64(k)) | (x >> np.uint64(32 - k))) & _M32
+
+
+@njit(cache=True, nogil=True)
+def _next_u32(s):
+    result = (_rotl((s[1] * np.uint64(5)) & _M32, 7) * np.uint64(9)) & _M32
+    t = (s[1] << np.uint64(9)) & _M32
+    s[2] ^= s[0]
+    s[3] ^= s[1]
+    s[1] ^= s[2]
+    s[0] ^= s[3]
+    s[2] ^= t
+    s[3] = _rotl(s[3], 11)
+    return result
+
+
+@njit(cache=True, nogil=True)
+def _randint(s, n):
+    """Uniform int in [0, n)."""
+    return np.int64((_next_u32(s) * np.uint64(n)) >> np.uint64(32))
+
+
+@njit(cache=True, nogil=True)
+def seed_rng(seed):
+    """xoshiro128** state from a 64-bit seed, expanded with splitmix64."""
+    s = np.zeros(4, dtype=np.uint64)
+    z = np.uint64(seed)
+    for i in range(2):
+        z += np.uint64(0x9E3779B97F4A7C15)
+        x = z
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        x = x ^ (x >> np.uint64(31))
+        s[2 * i] = x & _M32
+        s[2 * i + 1] = x >> np.uint64(32)
+    return s
+
+
+# ---------- Rules ----------
+
+@njit(cache=True, nogil=True)
+def _draw(st, pl, n, rng):
+    for _ in range(n):
+        if st.deck_top[pl] < 0:
+            # reshuffle discard into deck (Fisher-Yates)
+            count = np.int64(st.discard_count[pl])
+            for i in range(count):
+                st.deck[pl, i] = st.discard[pl, i]
+            for i in range(count - 1, 0, -1):
+                j = _randint(rng, i + 1)
+                tmp = st.deck[pl, i]
+                st.deck[pl, i] = st.deck[pl, j]
+                st.deck[pl, j] = tmp
+            st.discard_count[pl] = 0
+            st.deck_top[pl] = count - 1
+        if st.deck_top[pl] >= 0:
+            st.hand_cards[pl, st.hand_count[pl]] = st.deck[pl, st.deck_top[pl]]
+            st.hand_count[pl] += 1
+            st.deck_top[pl] -= 1
+
+
+@njit(cache=True, nogil=True)
+def start_phase(st, pl, rng):
+    st.cp[pl] = min(MAX_CP, st.cp[pl] + CP_PER_TURN)
+    _draw(st, pl, 1, rng)
+    # reset attacks
+    for u in range(st.unit_owner.shape[0]):
+        if st.unit_owner[u] == pl + 1:
+            st.unit_attacked[u] = False
+
+
+@njit(cache=True, nogil=True)
+def deploy_troop_from_hand(st, pl, hand_index, zone):
+    if hand_index < 0 or hand_index >= st.hand_count[pl]:
+        return False
+    card = st.hand_cards[pl, hand_index]
+    if st.card_kind[card] != KIND_TROOP:
+        return False
+    if st.zone_count[zone] >= st.zone_cap[zone]:
+        return False
+    uid = -1
+    for u in range(st.unit_owner.shape[0]):
+        if st.unit_owner[u] == 0:
+            uid = u
+            break
+    if uid < 0:
+        return False
+
+    st.unit_card[uid] = card
+    st.unit_owner[uid] = pl + 1
+    st.unit_str[uid] = st.card_str[card]
+    st.unit_arm[uid] = st.card_arm[card]
+    st.unit_coh[uid] = st.card_coh[card]
+    st.unit_ammo[uid] = st.card_ammo[card]
+    st.unit_attacked[uid] = False
+    st.zone_unit_ids[zone, st.zone_count[zone]] = uid
+    st.zone_count[zone] += 1
+    st.discard[pl, st.discard_count[pl]] = card
+    st.discard_count[pl] += 1
+    # swap-remove, as in Game.deploy_troop_from_hand
+    last = st.hand_count[pl] - 1
+    st.hand_cards[pl, hand_index] = st.hand_cards[pl, last]
+    st.hand_count[pl] = last
+    return True
+
+
+@njit(cache=True, nogil=True)
+def _random_action(st, pl, rng):
+    """Pick uniformly among legal deploys and ending the turn.
+
+    Returns (hand_index, zone), or (-1, -1) to end the turn.
+    """
+    n_hand = np.int64(st.hand_count[pl])
+    n_legal = 0
+    for h in range(n_hand):
+        if st.card_kind[st.hand_cards[pl, h]] == KIND_TROOP:
+            for zone in DEPLOY_ZONES:
+                if st.zone_count[zone] < st.zone_cap[zone]:
+                    n_legal += 1
+    pick = _randint(rng, n_legal + 1)
+    if pick == n_legal:
+        return -1, -1
+    for h in range(n_hand):
+        if st.card_kind[st.hand_cards[pl, h]] == KIND_TROOP:
+            for zone in DEPLOY_ZONES:
+                if st.zone_count[zone] < st.zone_cap[zone]:
+                    if pick == 0:
+                        return h, zone
+                    pick -= 1
+    return -1, -1
+
+
+@njit(cache=True, nogil=True)
+def game_over(st):
+    """Winning pid, or 0 while both players have morale."""
+    broken0 = np.int64(st.morale[0] <= 0)
+    broken1 = np.int64(st.morale[1] <= 0)
+    # same precedence as Game.game_over: P1 broken -> 2, else P2 broken -> 1
+    return 2 * broken0 + broken1 * (1 - broken0)
+
+
+@njit(cache=True, nogil=True)
+def _evaluate(st):
+    """Winner of a truncated rollout: higher morale, then more STR on board."""
+    if st.morale[0] != st.morale[1]:
+        return 1 if st.morale[0] > st.morale[1] else 2
+    board = np.zeros(2, dtype=np.int64)
+    for u in range(st.unit_owner.shape[0]):
+        if st.unit_owner[u] != 0 and st.unit_coh[u] > 0:
+            board[st.unit_owner[u] - 1] += st.unit_str[u]
+    if board[0] == board[1]:
+        return 0
+    return 1 if board[0] > board[1] else 2
+
+
+@njit(cache=True, nogil=True)
+def rollout(st, rng, max_turns=30):
+    """Play random turns from st (mutated in place) and return the winner.
+
+    Returns 1 or 2 for the winning pid, 0 for a draw.
+    """
+    while st.turn[0] <= max_turns:
+        winner = game_over(st)
+        if winner != 0:
+            return winner
+        pl = st.turn[1] - 1
+        start_phase(st, pl, rng)
+        while True:
+            h, zone = _random_action(st, pl, rng)
+            if h < 0:
+                break
+            deploy_troop_from_hand(st, pl, h, zone)
+        # swap player
+        st.turn[1] = 2 if st.turn[1] == 1 else 1
+        if st.turn[1] == 1:
+            st.turn[0] += 1
+    winner = game_over(st)
+    if winner != 0:
+        return winner
+    return _evaluate(st)
+
+
+# ---------- Root-parallel search ----------
+
+@njit(parallel=True, nogil=True, cache=True)
+def run_rollouts(st, n_rollouts, seed, results, max_turns=30):
+    """Play n_rollouts independent rollouts from st into results[:n_rollouts].
+
+    st itself is left untouched; rollout i uses its own RNG seeded with seed + i.
+    """
+    for i in prange(n_rollouts):
+        results[i] = rollout(copy_state(st), seed_rng(seed + i), max_turns)
+
+
+def simulate(game: Game, n_rollouts: int, seed: Optional[int] = None,
+             max_turns: int = 30) -> np.ndarray:
+    """Root-parallel rollouts from the current game position.
+
+    Without a seed, one is drawn from a stream spawned off game.rng, so a
+    seeded Game gives reproducible searches without disturbing its own draws.
+    Returns counts indexed by outcome: [draws, P1 wins, P2 wins].
+    """
+    if seed is None:
+        seed = int(game.rng.spawn(1)[0].integers(2**63))
+    results = np.empty(n_rollouts, dtype=np.int8)
+    run_rollouts(state_from_game(game), n_rollouts, seed, results, max_turns)
+    return np.bincount(results, minlength=3)
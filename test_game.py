@@ -0,0 +1,117 @@
+# Checks for the Python Game engine.
+# Run with: python -m pytest
+
+import copy
+import pickle
+
+from game import CARD_IDS, Game, PlayerState, ZoneId
+
+
+MARINES = CARD_IDS["troop_marines"]
+SCOUTS = CARD_IDS["troop_scouts"]
+MARCH = CARD_IDS["strat_march"]
+
+
+def _game_with_unit_in(zid):
+    g = Game(0)
+    g.p1.hand = [MARINES]
+    g.deploy_troop_from_hand(g.p1, 0, zid)
+    return g
+
+
+def test_print_board_sees_touched_column_writes(capsys):
+    g = _game_with_unit_in(ZoneId.HQ)
+    (uid,) = g.units_in(ZoneId.HQ)
+    start = int(g.u_coh[uid])
+    g.print_board()
+    assert f"(COH {start})" in capsys.readouterr().out
+
+    # a zone-wide pass, bypassing Unit, reports the zone it changed
+    g.u_coh[g.units_in(ZoneId.HQ)] -= 3
+    g.touch_zone(ZoneId.HQ)
+    g.print_board()
+    assert f"(COH {start - 3})" in capsys.readouterr().out
+
+
+def test_game_over_precedence():
+    g = Game(0)
+    assert g.game_over() is None
+    g.p2.morale = 0
+    assert g.game_over() == 1
+    g.p1.morale = -1
+    assert g.game_over() == 2  # P1 is checked first
+
+
+def test_player_state_repr_shows_morale_and_cp():
+    g = Game(0)
+    g.p1.cp = 3
+    assert "morale=25" in repr(g.p1) and "cp=3" in repr(g.p1)
+
+
+def test_game_copies_and_pickles():
+    g = Game(0)
+    g.p2.morale -= 4
+    for clone in (copy.deepcopy(g), pickle.loads(pickle.dumps(g))):
+        assert clone.p2.morale == 21
+        assert clone.p1.hand == g.p1.hand
+        clone.p1.morale = 0
+        assert g.p1.morale == 25
+
+
+def test_player_state_equality_ignores_deck_array():
+    g = Game(0)
+    assert g.p1 != PlayerState(pid=1)  # different hands, no ValueError
+    assert PlayerState(pid=1) == PlayerState(pid=1)
+
+
+def test_draw_takes_cards_from_the_top_in_order():
+    g = Game(0)
+    p = g.p1
+    p.hand = []
+    p.deck[:5] = [1, 2, 3, 4, 5]
+    p.deck_top = 4
+    g._draw(p, 3)
+    assert p.hand == [5, 4, 3]
+    assert p.deck_top == 1
+
+
+def test_draw_reshuffles_discard_when_deck_runs_out():
+    g = Game(0)
+    p = g.p1
+    p.hand = []
+    p.deck[:2] = [1, 2]
+    p.deck_top = 1
+    p.discard = [7, 8, 9]
+    g._draw(p, 4)
+    assert p.hand[:2] == [2, 1]
+    assert sorted(p.hand[2:] + p.deck[:p.deck_top + 1].tolist()) == [7, 8, 9]
+    assert p.discard == [] and p.deck_top == 0
+
+
+def test_batched_draw_matches_single_draws():
+    a, b = Game(3), Game(3)
+    a._draw(a.p1, 40)  # runs through a reshuffle
+    for _ in range(40):
+        b._draw(b.p1, 1)
+    assert a.p1.hand == b.p1.hand
+
+
+def test_hand_view_maps_display_numbers_after_swap_remove():
+    g = Game(0)
+    p = g.p1
+    p.hand = [MARCH, SCOUTS, MARINES]
+    view = g.hand_view(p)
+    assert [p.hand[i] for i in view] == sorted(p.hand)
+    # deploy display #1 (marines), then #1 again is scouts
+    assert g.deploy_troop_from_hand(p, view[0], ZoneId.HQ)
+    view = g.hand_view(p)
+    assert [p.hand[i] for i in view] == [SCOUTS, MARCH]
+    assert g.deploy_troop_from_hand(p, view[0], ZoneId.HQ)
+    assert p.hand == [MARCH]
+
+
+def test_same_seed_same_game():
+    a, b = Game(11), Game(11)
+    assert a.p1.deck.tolist() == b.p1.deck.tolist()
+    assert a.p2.hand == b.p2.hand
+    assert Game(12).p1.deck.tolist() != a.p1.deck.tolist()
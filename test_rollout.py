@@ -0,0 +1,99 @@
+# Parity checks between the Numba rollout kernel and the Python Game.
+# Run with: python -m pytest
+
+import numpy as np
+import pytest
+
+import rollout
+from game import CARD_IDS, Game, ZoneId
+
+
+MARINES = CARD_IDS["troop_marines"]
+SCOUTS = CARD_IDS["troop_scouts"]
+MARCH = CARD_IDS["strat_march"]
+
+
+def _game_with_troop():
+    """Seeded game where P1's hand is [MARCH, MARINES, SCOUTS]; troop at index 1."""
+    g = Game(0)
+    g.p1.hand = [MARCH, MARINES, SCOUTS]
+    return g
+
+
+def test_xoshiro128starstar_reference_vector():
+    # first outputs of the reference C implementation from state {1, 2, 3, 4}
+    s = np.array([1, 2, 3, 4], dtype=np.uint64)
+    got = [int(rollout._next_u32(s)) for _ in range(8)]
+    assert got == [11520, 0, 5927040, 70819200, 2031721883, 1637235492, 1287239034, 3734860849]
+
+
+def test_state_from_game_matches_game():
+    g = _game_with_troop()
+    g.deploy_troop_from_hand(g.p1, 1, ZoneId.HQ)
+    st = rollout.state_from_game(g)
+
+    for zid in ZoneId:
+        assert st.zone_cap[zid] == g.zone(zid).capacity
+        assert st.zone_count[zid] == g.zone(zid).count
+    (uid,) = g.units_in(ZoneId.HQ)
+    kid = st.zone_unit_ids[ZoneId.HQ, 0]
+    for col in ("owner", "card", "str", "arm", "coh", "ammo"):
+        assert getattr(st, "unit_" + col)[kid] == getattr(g, "u_" + col)[uid]
+    for pl, p in enumerate((g.p1, g.p2)):
+        assert list(st.hand_cards[pl, :st.hand_count[pl]]) == p.hand
+        assert list(st.discard[pl, :st.discard_count[pl]]) == p.discard
+        assert st.deck_top[pl] == p.deck_top
+        assert st.morale[pl] == p.morale
+        assert st.cp[pl] == p.cp
+
+
+def test_kernel_deploy_matches_game():
+    g = _game_with_troop()
+    st = rollout.state_from_game(g)
+    h = 1
+    assert rollout.deploy_troop_from_hand(st, 0, h, ZoneId.RESERVE)
+    assert g.deploy_troop_from_hand(g.p1, h, ZoneId.RESERVE)
+
+    after = rollout.state_from_game(g)
+    for name in ("zone_count", "zone_unit_ids", "unit_owner", "unit_card", "unit_str",
+                 "unit_coh", "hand_count", "discard", "discard_count"):
+        assert np.array_equal(getattr(st, name), getattr(after, name)), name
+    assert list(st.hand_cards[0, :st.hand_count[0]]) == g.p1.hand
+
+
+def test_negative_coh_survives_snapshot():
+    g = _game_with_troop()
+    g.deploy_troop_from_hand(g.p1, 1, ZoneId.HQ)
+    (uid,) = g.units_in(ZoneId.HQ)
+    g.unit(uid).coh = -2
+
+    st = rollout.state_from_game(g)
+    assert st.unit_coh[st.zone_unit_ids[ZoneId.HQ, 0]] == -2
+    # a broken unit adds no STR, so scoring the position right away is a draw
+    st.turn[0] = 31
+    assert rollout.rollout(st, rollout.seed_rng(0), 30) == 0
+
+
+def test_kernel_reads_card_stats_from_state():
+    # card stats travel in the state, so edits can't be masked by Numba's cache
+    g = _game_with_troop()
+    st = rollout.state_from_game(g)
+    h = 1
+    card = g.p1.hand[h]
+    st.card_str[card] = 42
+    assert rollout.deploy_troop_from_hand(st, 0, h, ZoneId.HQ)
+    assert st.unit_str[st.zone_unit_ids[ZoneId.HQ, 0]] == 42
+
+
+def test_state_from_game_rejects_decks_over_capacity():
+    g = Game(0)
+    g.p2.deck = np.zeros(rollout.DECK_CAP + 1, dtype=g.p2.deck.dtype)
+    with pytest.raises(ValueError):
+        rollout.state_from_game(g)
+
+
+def test_simulate_is_reproducible_from_the_game_seed():
+    a, b = Game(7), Game(7)
+    assert rollout.simulate(a, 200).tolist() == rollout.simulate(b, 200).tolist()
+    # searching spawns its own stream, so the game's shuffles are unchanged
+    assert a.rng.integers(2**32) == Game(7).rng.integers(2**32)